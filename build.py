@@ -4,27 +4,122 @@ Build script for the wind turbine project.
 Compiles Rust library and sets up Python package.
 """
 
+import importlib.util
 import os
+import re
 import sys
 import subprocess
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run a command and handle errors"""
+# Subprocesses started by run_command that are still running, so a failed
+# step can stop the others instead of waiting for them
+_running = set()
+_running_lock = threading.Lock()
+_stopping = False
+
+def run_command(cmd, cwd=None, env=None, capture=True, pass_fds=()):
+    """Run a command and handle errors
+
+    With capture=False the output is streamed to our stdout/stderr instead of
+    being buffered, which suits long-running steps like cargo and pip.
+    """
     print(f"Running: {' '.join(cmd)}")
+    pipe = subprocess.PIPE if capture else None
+    with _running_lock:
+        if _stopping:
+            return False
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, pass_fds=pass_fds,
+                                stdout=pipe, stderr=pipe, text=True)
+        _running.add(proc)
     try:
-        result = subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
-        if e.stdout:
-            print(f"stdout: {e.stdout}")
-        if e.stderr:
-            print(f"stderr: {e.stderr}")
+        stdout, stderr = proc.communicate()
+    finally:
+        with _running_lock:
+            _running.discard(proc)
+    if proc.returncode != 0:
+        print(f"Error: {subprocess.CalledProcessError(proc.returncode, cmd)}")
+        if stdout:
+            print(f"stdout: {stdout}")
+        if stderr:
+            print(f"stderr: {stderr}")
         return False
+    if stdout:
+        print(stdout)
+    return True
+
+def stop_running_commands():
+    """Terminate every running command and refuse to start new ones"""
+    global _stopping
+    with _running_lock:
+        _stopping = True
+        procs = list(_running)
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        proc.wait()
+
+def cargo_jobs():
+    """Cargo parallelism flags and the fds needed to join a parent jobserver
+
+    Returns (args, pass_fds). A jobserver advertised in MAKEFLAGS is used
+    instead of -j: named jobservers (fifo: on make >= 4.4, semaphores on
+    Windows) are reachable through the inherited environment, while the
+    pipe-based R,W form only works if those fds stay open in cargo, since
+    subprocess closes inherited fds by default. If they are not open in this
+    process, fall back to an explicit -j.
+    """
+    makeflags = os.environ.get("CARGO_MAKEFLAGS", "") or os.environ.get("MAKEFLAGS", "")
+    match = re.search(r"--jobserver-(?:auth|fds)=(\S+)", makeflags)
+    if match:
+        auth = match.group(1)
+        parts = auth.split(",")
+        if not all(part.isdigit() for part in parts):
+            return [], ()
+        fds = tuple(int(part) for part in parts)
+        try:
+            for fd in fds:
+                os.fstat(fd)
+        except OSError:
+            pass
+        else:
+            return [], fds
+    return ["-j", str(os.cpu_count() or 1)], ()
+
+def cargo_env():
+    """Environment for cargo, using sccache as the rustc wrapper when available"""
+    env = os.environ.copy()
+    if "RUSTC_WRAPPER" not in env:
+        wrapper = shutil.which("sccache")
+        if wrapper:
+            env["RUSTC_WRAPPER"] = wrapper
+    return env
+
+def newest_mtime(path):
+    """Newest modification time of a file or of any file under a directory"""
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_mtime
+    newest = 0.0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                newest = max(newest, newest_mtime(entry.path))
+            elif entry.is_file():
+                newest = max(newest, entry.stat().st_mtime)
+    return newest
+
+def rust_artifact_fresh(rust_dir, python_pkg_dir):
+    """Check whether the library in the Python package is newer than the Rust sources"""
+    dest_names = ["wind_calc.pyd"] if sys.platform == "win32" else ["libwind_calc.so", "libwind_calc.dylib"]
+    dests = [python_pkg_dir / name for name in dest_names if (python_pkg_dir / name).exists()]
+    if not dests:
+        return False
+    inputs = [rust_dir / "src", rust_dir / "Cargo.toml", rust_dir / "Cargo.lock"]
+    sources = max(newest_mtime(path) for path in inputs if path.exists())
+    return any(dest.stat().st_mtime > sources for dest in dests)
 
 def build_rust():
     """Build the Rust library"""
@@ -35,8 +130,15 @@ def build_rust():
         print("Error: rust directory not found")
         return False
     
+    python_pkg_dir = Path("python") / "wind_turbine"
+    if rust_artifact_fresh(rust_dir, python_pkg_dir):
+        print("Rust library is up to date, skipping cargo build")
+        return True
+    
     # Build in release mode
-    if not run_command(["cargo", "build", "--release"], cwd=rust_dir):
+    jobs, fds = cargo_jobs()
+    if not run_command(["cargo", "build", "--release", *jobs], cwd=rust_dir, env=cargo_env(),
+                       capture=False, pass_fds=fds):
         return False
     
     # Find the built library
@@ -57,7 +159,6 @@ def build_rust():
         return False
     
     # Copy to Python package
-    python_pkg_dir = Path("python") / "wind_turbine"
     if not python_pkg_dir.exists():
         python_pkg_dir.mkdir(parents=True)
     
@@ -65,8 +166,15 @@ def build_rust():
     dest_name = "wind_calc.pyd" if sys.platform == "win32" else lib_file.name
     dest_path = python_pkg_dir / dest_name
     
-    print(f"Copying {lib_file} to {dest_path}")
-    shutil.copy2(lib_file, dest_path)
+    # Hardlink when possible (no bytes copied), fall back to a copy across filesystems
+    print(f"Linking {lib_file} to {dest_path}")
+    if dest_path.exists() or dest_path.is_symlink():
+        dest_path.unlink()
+    try:
+        os.link(lib_file, dest_path)
+    except OSError:
+        print(f"Hardlink failed, copying {lib_file} to {dest_path}")
+        shutil.copy2(lib_file, dest_path)
     
     return True
 
@@ -79,16 +187,42 @@ def install_python_package():
         print("Error: python directory not found")
         return False
     
-    return run_command([sys.executable, "-m", "pip", "install", "-e", "."], cwd=python_dir)
+    return run_command([sys.executable, "-m", "pip", "install", "-e", "."], cwd=python_dir, capture=False)
 
-def run_tests():
-    """Run tests"""
-    print("Running Rust tests...")
-    if not run_command(["cargo", "test"], cwd="rust"):
-        return False
-    
+def rust_test_command():
+    """Command for the Rust test suite and the jobserver fds it needs"""
+    jobs, fds = cargo_jobs()
+    return ["cargo", "test", *jobs], fds
+
+def python_test_command():
+    """Command for the Python test suite, parallelised when pytest-xdist is installed"""
+    pytest_cmd = [sys.executable, "-m", "pytest", "tests/"]
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_cmd += ["-n", "auto"]
+    return pytest_cmd
+
+def run_tests(executor, rust_tests=None):
+    """Run Rust and Python tests concurrently
+
+    rust_tests may be a future for a Rust test run that was already started,
+    e.g. as soon as the Rust build finished.
+    """
+    futures = {}
+    if rust_tests is None:
+        print("Running Rust tests...")
+        cmd, fds = rust_test_command()
+        rust_tests = executor.submit(run_command, cmd, "rust", env=cargo_env(),
+                                     capture=False, pass_fds=fds)
+    futures[rust_tests] = "Rust tests"
     print("Running Python tests...")
-    return run_command([sys.executable, "-m", "pytest", "tests/"], cwd="python")
+    futures[executor.submit(run_command, python_test_command(), "python")] = "Python tests"
+    
+    ok = True
+    for future in as_completed(futures):
+        if not future.result():
+            print(f"{futures[future]} failed")
+            ok = False
+    return ok
 
 def main():
     """Main build function"""
@@ -99,33 +233,53 @@ def main():
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
     
+    with_tests = "--test" in sys.argv
+    
     # Build steps
     steps = [
         ("Building Rust library", build_rust),
         ("Installing Python package", install_python_package),
     ]
     
-    for step_name, step_func in steps:
-        print(f"\n{step_name}...")
-        if not step_func():
-            print(f"Failed at step: {step_name}")
-            return 1
-        print(f"✓ {step_name} completed")
-    
-    print("\n" + "=" * 40)
-    print("Build completed successfully!")
-    print("\nYou can now run:")
-    print("  wind-turbine design --wattage 50 --radius 0.5")
-    print("  wind-turbine-gui")
-    
-    # Optionally run tests
-    if "--test" in sys.argv:
-        print("\nRunning tests...")
-        if run_tests():
-            print("✓ All tests passed")
-        else:
-            print("✗ Some tests failed")
-            return 1
+    # The steps are independent (the Rust library is only loaded at runtime),
+    # so run them concurrently; both are dominated by subprocess wait time.
+    # Rust tests only depend on the Rust build, so they start as soon as it
+    # finishes instead of waiting for pip.
+    with ThreadPoolExecutor(max_workers=len(steps) + 1) as executor:
+        futures = {}
+        for step_name, step_func in steps:
+            print(f"\n{step_name}...")
+            futures[executor.submit(step_func)] = (step_name, step_func)
+        
+        rust_tests = None
+        for future in as_completed(futures):
+            step_name, step_func = futures[future]
+            if not future.result():
+                print(f"Failed at step: {step_name}")
+                # Stop the other steps rather than waiting for them to finish
+                stop_running_commands()
+                return 1
+            print(f"✓ {step_name} completed")
+            if with_tests and step_func is build_rust:
+                print("Running Rust tests...")
+                cmd, fds = rust_test_command()
+                rust_tests = executor.submit(run_command, cmd, "rust", env=cargo_env(),
+                                             capture=False, pass_fds=fds)
+        
+        print("\n" + "=" * 40)
+        print("Build completed successfully!")
+        print("\nYou can now run:")
+        print("  wind-turbine design --wattage 50 --radius 0.5")
+        print("  wind-turbine-gui")
+        
+        # Optionally run tests
+        if with_tests:
+            print("\nRunning tests...")
+            if run_tests(executor, rust_tests):
+                print("✓ All tests passed")
+            else:
+                print("✗ Some tests failed")
+                return 1
     
     return 0
 
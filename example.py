@@ -4,9 +4,7 @@ Example usage of the Wind Turbine Designer
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python', 'wind_turbine'))
-import wind_calc
+from wind_turbine import wind_calc
 from wind_turbine.visualize import plot_power_curve, plot_tsr_analysis
 
 def basic_design_example():
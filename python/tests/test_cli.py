@@ -1,7 +1,10 @@
+import csv
 import subprocess
 import json
 import pathlib
 
+import pytest
+
 def test_cli_design(tmp_path):
     out = tmp_path / "summary.json"
     cmd = [
@@ -19,4 +22,79 @@ def test_cli_design(tmp_path):
     assert out.exists()
     data = json.loads(out.read_text())
     assert "rotor_area" in data
-    # Note: target_wattage is not in output, it's an input parameter
\ No newline at end of file
+    assert not (tmp_path / "summary.csv").exists()
+    # Note: target_wattage is not in output, it's an input parameter
+
+def test_cli_design_csv(tmp_path):
+    out = tmp_path / "summary.json"
+    cmd = ["wind-turbine", "design", "--wattage", "50", "--output", str(out), "--csv"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert result.returncode == 0
+    header = (tmp_path / "summary.csv").read_text().splitlines()[0]
+    assert "rotor_area" in header.split(",")
+
+def test_cli_design_csv_non_json_output(tmp_path):
+    out_dir = tmp_path / "results.json.d"
+    out_dir.mkdir()
+    out = out_dir / "design.txt"
+    cmd = ["wind-turbine", "design", "--wattage", "50", "--output", str(out), "--csv"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert result.returncode == 0
+    # The JSON is not overwritten and the directory name is left alone
+    assert "rotor_area" in json.loads(out.read_text())
+    header = (out_dir / "design.csv").read_text().splitlines()[0]
+    assert "rotor_area" in header.split(",")
+
+def run_design(tmp_path, name, *args):
+    out = tmp_path / f"{name}.json"
+    cmd = ["wind-turbine", "design", *args, "--output", str(out)]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert result.returncode == 0
+    return json.loads(out.read_text())
+
+def test_cli_design_many(tmp_path):
+    inp = tmp_path / "designs.csv"
+    inp.write_text(
+        "wattage,radius,blades,generator\n"
+        "50,,,\n"
+        "100,0.6,4,Brushed\n"
+    )
+    out = tmp_path / "results.csv"
+    cmd = ["wind-turbine", "design-many", str(inp), str(out)]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert result.returncode == 0
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+
+    # Omitted columns fall back to the defaults of `design`
+    expected = [
+        run_design(tmp_path, "defaults", "--wattage", "50"),
+        run_design(tmp_path, "brushed", "--wattage", "100", "--radius", "0.6",
+                   "--blades", "4", "--generator", "brushed"),
+    ]
+    for row, data in zip(rows, expected):
+        assert float(row["rpm"]) == pytest.approx(data["rpm"])
+        assert float(row["tsr"]) == pytest.approx(data["tsr"])
+        assert row["generator_type"] == data["generator_type"]
+
+def test_cli_design_many_invalid_rows(tmp_path):
+    out = tmp_path / "results.csv"
+    bad_rows = [
+        "50,0.5,3,brushles",
+        "50,0.5,300,brushless",
+        "50,0.5,-1,brushless",
+        # Short row: trailing fields are missing
+        "50,0.5",
+        # Extra field
+        "50,0.5,3,brushless,extra",
+    ]
+    for bad_row in bad_rows:
+        inp = tmp_path / "designs.csv"
+        inp.write_text("wattage,radius,blades,generator\n50,0.5,3,brushless\n" + bad_row + "\n")
+        cmd = ["wind-turbine", "design-many", str(inp), str(out)]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        assert result.returncode != 0
+        assert "line 3" in result.stderr
+        assert "Traceback" not in result.stderr
+        assert not out.exists()
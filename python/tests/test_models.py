@@ -1,8 +1,5 @@
 import pytest
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'wind_turbine'))
-import wind_calc
+from wind_turbine import wind_calc
 
 def test_env_creation():
     """Test environmental conditions creation"""
@@ -65,4 +62,49 @@ def test_solver_design_summary():
     assert summary["tsr"] > 0
     assert summary["rpm"] > 0
     assert summary["cut_in"] == 2.5
-    assert summary["cut_out"] == 25.0
\ No newline at end of file
+    assert summary["cut_out"] == 25.0
+
+def test_solver_reconfigure():
+    """Test that a reconfigured solver matches a freshly built one"""
+    constraints = wind_calc.Constraints(
+        blade_radius=0.5,
+        num_blades=3,
+        generator_type=wind_calc.GeneratorType.Brushless
+    )
+    solver = wind_calc.PySolver(wind_calc.PyTurbineConfig(
+        target_wattage=50.0,
+        env=wind_calc.Env(air_density=1.225, wind_speed=6.0),
+        constraints=constraints
+    ))
+    env = wind_calc.Env(air_density=1.2, wind_speed=8.0)
+    solver.reconfigure(env, 100.0, 0.6)
+
+    constraints.blade_radius = 0.6
+    fresh = wind_calc.PySolver(wind_calc.PyTurbineConfig(
+        target_wattage=100.0,
+        env=env,
+        constraints=constraints
+    ))
+    assert solver.design_summary() == fresh.design_summary()
+
+def test_pooled_design_summary_matches_fresh_solver():
+    """Test cached/pooled summaries against fresh solvers for one pool key"""
+    from wind_turbine.util import design_summary
+
+    def fresh_summary(wattage, radius):
+        cfg = wind_calc.PyTurbineConfig(
+            target_wattage=wattage,
+            env=wind_calc.Env(air_density=1.225, wind_speed=6.0),
+            constraints=wind_calc.Constraints(
+                blade_radius=radius,
+                num_blades=3,
+                generator_type=wind_calc.GeneratorType.Brushless
+            )
+        )
+        return wind_calc.PySolver(cfg).design_summary()
+
+    # Same blades/generator throughout, so every call shares one pooled
+    # solver; repeats hit the lru_cache after it has been reconfigured
+    for wattage, radius in [(50.0, 0.5), (100.0, 0.6), (50.0, 0.5), (75.0, 0.4), (100.0, 0.6)]:
+        summary = design_summary(wattage, 1.225, 6.0, radius, 3, "brushless")
+        assert summary == fresh_summary(wattage, radius)
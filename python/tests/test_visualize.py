@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from wind_turbine import visualize
+
+def test_cp_curve_matches_reference():
+    """Test the Cp kernel (Numba or NumPy fallback) against the scalar formula"""
+    tsr_range = np.linspace(1, 15, 100)
+    a, b, c = 0.5, 0.3, 0.02
+    expected = [max(0, a * tsr * (1.0 - b * tsr + c * tsr**2)) for tsr in tsr_range]
+    assert visualize._cp_curve(tsr_range) == pytest.approx(expected)
+    # Second call goes through the cached kernel
+    assert visualize._cp_curve(tsr_range) == pytest.approx(expected)
+
+def test_power_curve():
+    """Test power curve clipping, values and grid reuse"""
+    cfg = {'blade_radius': 0.6, 'air_density': 1.225, 'cut_in': 2.5, 'cut_out': 20.0}
+    v, power = visualize.power_curve(cfg)
+
+    outside = (v < cfg['cut_in']) | (v > cfg['cut_out'])
+    assert outside.any() and (~outside).any()
+    assert np.all(power[outside] == 0)
+    expected = 0.4 * 0.5 * cfg['air_density'] * np.pi * cfg['blade_radius']**2 * v[~outside]**3
+    assert power[~outside] == pytest.approx(expected)
+
+    # The wind speed grid is cached, shared and read-only
+    v2, power2 = visualize.power_curve(cfg)
+    assert v2 is v
+    assert power2 is not power
+    with pytest.raises(ValueError):
+        v[0] = 1.0
+
+def test_power_curve_on_matches_power_curve():
+    """Test the precomputed-grid entry point used by design comparisons"""
+    cfg = {'blade_radius': 0.4, 'air_density': 1.2, 'cut_in': 3.0, 'cut_out': 25.0}
+    v, v_cubed = visualize.wind_speed_grid()
+    _, power = visualize.power_curve(cfg)
+    assert visualize.power_curve_on(v, v_cubed, cfg) == pytest.approx(power)
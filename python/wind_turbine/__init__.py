@@ -1,6 +1,10 @@
 from .cli import cli
-from .gui import run_gui
+
+def run_gui():
+    """Launch the GUI (PySide6 is only imported when the GUI is requested)"""
+    from .gui import run_gui as _run_gui
+    _run_gui()
 
 def main():
     """Main entry point for CLI"""
-    cli()
\ No newline at end of file
+    cli()
@@ -1,7 +1,9 @@
+import csv
 import json
+from pathlib import Path
 import click
-import pandas as pd
 from . import wind_calc  # Rust extension
+from .util import design_summary, make_config
 
 @click.group()
 def cli():
@@ -15,28 +17,76 @@ def cli():
 @click.option("--blades", type=int, default=3, help="Number of blades")
 @click.option("--generator", type=click.Choice(["brushed", "brushless"]), default="brushless")
 @click.option("--output", type=click.Path(), default="summary.json")
-def design(wattage, air_density, wind_speed, radius, blades, generator, output):
+@click.option("--csv/--no-csv", "write_csv", default=False, help="Also write a CSV next to the JSON output")
+def design(wattage, air_density, wind_speed, radius, blades, generator, output, write_csv):
     """Generate a turbine design for the given wattage."""
-    cfg = wind_calc.PyTurbineConfig(
-        target_wattage=wattage,
-        env=wind_calc.Env(air_density=air_density, wind_speed=wind_speed),
-        constraints=wind_calc.Constraints(
-            blade_radius=radius,
-            num_blades=blades,
-            generator_type=wind_calc.GeneratorType.Brushless if generator == "brushless" else wind_calc.GeneratorType.Brushed
-        )
-    )
-    solver = wind_calc.PySolver(cfg)
-    summary = solver.design_summary()
+    csv_path = Path(output).with_suffix(".csv")
+    if write_csv and csv_path == Path(output):
+        raise click.BadParameter("must not end in .csv when --csv is given", param_hint="--output")
+    summary = design_summary(wattage, air_density, wind_speed, radius, blades, generator)
     # Save to JSON
     with open(output, "w") as f:
         json.dump(summary, f, indent=2)
     click.echo(f"Design written to {output}")
 
     # Optional CSV
-    df = pd.DataFrame([summary])
-    df.to_csv(output.replace(".json", ".csv"), index=False)
-    click.echo(f"CSV written to {output.replace('.json', '.csv')}")
+    if write_csv:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(summary.keys()))
+            writer.writeheader()
+            writer.writerow(summary)
+        click.echo(f"CSV written to {csv_path}")
+
+@cli.command("design-many")
+@click.argument("input_csv", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_csv", type=click.Path(dir_okay=False))
+def design_many(input_csv, output_csv):
+    """Generate designs for every row of INPUT_CSV in a single solver call.
+
+    Columns mirror the options of `design` (wattage, air_density, wind_speed,
+    radius, blades, generator); all but wattage fall back to the same defaults.
+    """
+    with open(input_csv, newline="") as f:
+        reader = csv.DictReader(f)
+        numbered_rows = [(reader.line_num, row) for row in reader]
+    if not numbered_rows:
+        raise click.ClickException(f"No designs found in {input_csv}")
+
+    configs = []
+    for line, row in numbered_rows:
+        try:
+            # DictReader files extra fields under None and fills missing ones with None
+            n_fields = len(reader.fieldnames)
+            if None in row:
+                raise ValueError(f"expected {n_fields} fields, got {n_fields + len(row[None])}")
+            if None in row.values():
+                raise ValueError(f"expected {n_fields} fields, got {sum(v is not None for v in row.values())}")
+            generator = (row.get("generator") or "brushless").strip().lower()
+            if generator not in ("brushed", "brushless"):
+                raise ValueError(f"unknown generator {generator!r} (expected brushed or brushless)")
+            blades = int(row.get("blades") or 3)
+            if not 1 <= blades <= 255:
+                raise ValueError(f"blades must be between 1 and 255, got {blades}")
+            configs.append(make_config(
+                float(row["wattage"]),
+                float(row.get("air_density") or 1.225),
+                float(row.get("wind_speed") or 6.0),
+                float(row.get("radius") or 0.5),
+                blades,
+                generator,
+            ))
+        except KeyError as e:
+            raise click.ClickException(f"Invalid design on line {line} of {input_csv}: missing column {e}")
+        except (ValueError, TypeError, OverflowError) as e:
+            raise click.ClickException(f"Invalid design on line {line} of {input_csv}: {e}")
+    summaries = wind_calc.batch_design(configs)
+
+    results = [{**row, **summary} for (_, row), summary in zip(numbered_rows, summaries)]
+    with open(output_csv, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    click.echo(f"{len(results)} designs written to {output_csv}")
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
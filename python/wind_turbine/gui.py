@@ -1,8 +1,7 @@
 import sys
-import json
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel,
                                QLineEdit, QPushButton, QFileDialog, QMessageBox)
-from . import wind_calc
+from .util import design_summary
 
 class DesignApp(QWidget):
     def __init__(self):
@@ -32,24 +31,17 @@ class DesignApp(QWidget):
 
     def generate(self):
         try:
-            cfg = wind_calc.PyTurbineConfig(
-                target_wattage=float(self.wattage.text()),
-                env=wind_calc.Env(air_density=float(self.air_density.text()),
-                                  wind_speed=float(self.wind_speed.text())),
-                constraints=wind_calc.Constraints(
-                    blade_radius=float(self.radius.text()),
-                    num_blades=int(self.blades.text()),
-                    generator_type=wind_calc.GeneratorType.Brushless
-                )
-            )
-            solver = wind_calc.PySolver(cfg)
-            summary = solver.design_summary()
+            summary = design_summary(float(self.wattage.text()),
+                                     float(self.air_density.text()),
+                                     float(self.wind_speed.text()),
+                                     float(self.radius.text()),
+                                     int(self.blades.text()))
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
             return
 
         # Pretty print
-        msg = json.dumps(summary, indent=2)
+        msg = "\n".join(f"{k:>15}: {v}" for k, v in summary.items())
         QMessageBox.information(self, "Design Summary", msg)
 
 def run_gui():
@@ -0,0 +1,39 @@
+import functools
+from . import wind_calc  # Rust extension
+
+def make_config(wattage, air_density, wind_speed, radius, blades, generator="brushless"):
+    """Build the Rust turbine configuration from plain values"""
+    return wind_calc.PyTurbineConfig(
+        target_wattage=wattage,
+        env=wind_calc.Env(air_density=air_density, wind_speed=wind_speed),
+        constraints=wind_calc.Constraints(
+            blade_radius=radius,
+            num_blades=blades,
+            generator_type=wind_calc.GeneratorType.Brushless if generator == "brushless" else wind_calc.GeneratorType.Brushed
+        )
+    )
+
+_solver_pool = {}
+
+def get_solver(wattage, air_density, wind_speed, radius, blades, generator="brushless"):
+    """Pooled solver for (blades, generator), reconfigured for the given operating point"""
+    key = (blades, generator)
+    solver = _solver_pool.get(key)
+    if solver is None:
+        solver = _solver_pool[key] = wind_calc.PySolver(
+            make_config(wattage, air_density, wind_speed, radius, blades, generator))
+    else:
+        solver.reconfigure(wind_calc.Env(air_density=air_density, wind_speed=wind_speed),
+                           wattage, radius)
+    return solver
+
+@functools.lru_cache(maxsize=128)
+def _summary(wattage, air_density, wind_speed, radius, blades, generator):
+    """Run the Rust solver once per distinct set of inputs"""
+    solver = get_solver(wattage, air_density, wind_speed, radius, blades, generator)
+    return tuple(solver.design_summary().items())
+
+def design_summary(wattage, air_density, wind_speed, radius, blades, generator="brushless"):
+    """Design summary dict for the given inputs, cached across identical calls"""
+    return dict(_summary(float(wattage), float(air_density), float(wind_speed),
+                         float(radius), int(blades), generator))
@@ -1,90 +1,160 @@
-import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 
-def power_curve(cfg, min_v=0.0, max_v=25.0, steps=200):
-    """Generate power curve data for visualization"""
-    v = np.linspace(min_v, max_v, steps)
+_grid_cache = {}
+_cp_kernel = None
+
+def _cp_curve_np(tsr, a=0.5, b=0.3, c=0.02):
+    """Simplified Cp model, clipped at zero"""
+    return np.maximum(0.0, a * tsr * (1.0 - b * tsr + c * tsr * tsr))
+
+def _cp_curve(tsr):
+    """Cp over an array of TSRs, JIT-compiled with Numba when it is installed
+
+    Falls back to the NumPy version if Numba is missing or fails to compile
+    the kernel (compilation happens on the first call).
+    """
+    global _cp_kernel
+    if _cp_kernel is None:
+        try:
+            from numba import njit
+            from numba.core.errors import NumbaError
+        except ImportError:
+            _cp_kernel = _cp_curve_np
+        else:
+            kernel = njit(cache=True, fastmath=True)(_cp_curve_np)
+            try:
+                cp = kernel(tsr)
+            except NumbaError:
+                _cp_kernel = _cp_curve_np
+            else:
+                _cp_kernel = kernel
+                return cp
+    return _cp_kernel(tsr)
+
+def power_curve_on(v, v_cubed, cfg):
+    """Power (W) over a precomputed wind speed grid and its cube"""
     area = np.pi * cfg['blade_radius']**2
     # Simplified: Cp = 0.4, rotor speed ~ TSR * V / R
-    tsr = 7.0
     cp = 0.4
-    power = cp * 0.5 * cfg['air_density'] * area * v**3
+    power = (cp * 0.5 * cfg['air_density'] * area) * v_cubed
     # Cut‑in/out clipping
-    power[(v < cfg['cut_in']) | (v > cfg['cut_out'])] = 0
-    return pd.DataFrame({"wind_speed": v, "power": power})
+    mask = (v >= cfg['cut_in']) & (v <= cfg['cut_out'])
+    np.multiply(power, mask, out=power)
+    return power
+
+def wind_speed_grid(min_v=0.0, max_v=25.0, steps=200):
+    """Wind speed grid and its cube, cached per (min_v, max_v, steps)
+
+    The cached arrays are shared between callers and therefore read-only.
+    """
+    key = (min_v, max_v, steps)
+    grid = _grid_cache.get(key)
+    if grid is None:
+        v = np.linspace(min_v, max_v, steps)
+        v_cubed = v**3
+        v.setflags(write=False)
+        v_cubed.setflags(write=False)
+        grid = _grid_cache[key] = (v, v_cubed)
+    return grid
 
-def plot_power_curve(cfg):
-    """Plot power curve for the turbine configuration"""
-    df = power_curve(cfg)
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['wind_speed'], df['power'] / 1000, label="Power (kW)", linewidth=2)
-    plt.xlabel("Wind speed (m/s)")
-    plt.ylabel("Power (kW)")
-    plt.title("Wind Turbine Power Curve")
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.xlim(0, 25)
-    plt.ylim(0, None)
-    plt.show()
+def power_curve(cfg, min_v=0.0, max_v=25.0, steps=200):
+    """Generate power curve data for visualization as (wind_speed, power) arrays
+
+    wind_speed is the cached grid from wind_speed_grid: it is shared between
+    calls and read-only, so copy it before modifying. power is a new array.
+    """
+    v, v_cubed = wind_speed_grid(min_v, max_v, steps)
+    return v, power_curve_on(v, v_cubed, cfg)
+
+def plot_power_curve(cfg, ax=None):
+    """Plot power curve for the turbine configuration
+
+    If ax is given the curve is drawn onto it and the caller owns the figure;
+    otherwise a new figure is created and shown.
+    """
+    show = ax is None
+    if show:
+        import matplotlib.pyplot as plt
+        _, ax = plt.subplots(figsize=(10, 6))
+    v, power = power_curve(cfg)
+    ax.plot(v, power / 1000, label="Power (kW)", linewidth=2)
+    ax.set_xlabel("Wind speed (m/s)")
+    ax.set_ylabel("Power (kW)")
+    ax.set_title("Wind Turbine Power Curve")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(0, 25)
+    ax.set_ylim(0, None)
+    if show:
+        plt.show()
 
-def plot_design_comparison(designs):
-    """Compare multiple turbine designs"""
-    plt.figure(figsize=(12, 8))
+def plot_design_comparison(designs, ax=None):
+    """Compare multiple turbine designs
+
+    If ax is given the curves are drawn onto it and the caller owns the figure;
+    otherwise a new figure is created and shown.
+    """
+    show = ax is None
+    if show:
+        import matplotlib.pyplot as plt
+        _, ax = plt.subplots(figsize=(12, 8))
     
+    # All designs share the same wind speed grid
+    v, v_cubed = wind_speed_grid()
     for i, (name, cfg) in enumerate(designs.items()):
-        df = power_curve(cfg)
-        plt.plot(df['wind_speed'], df['power'] / 1000, 
+        power = power_curve_on(v, v_cubed, cfg)
+        ax.plot(v, power / 1000, 
                 label=f"{name} ({cfg['blade_radius']:.1f}m radius)", 
                 linewidth=2)
     
-    plt.xlabel("Wind speed (m/s)")
-    plt.ylabel("Power (kW)")
-    plt.title("Wind Turbine Design Comparison")
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.xlim(0, 25)
-    plt.ylim(0, None)
-    plt.show()
+    ax.set_xlabel("Wind speed (m/s)")
+    ax.set_ylabel("Power (kW)")
+    ax.set_title("Wind Turbine Design Comparison")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(0, 25)
+    ax.set_ylim(0, None)
+    if show:
+        plt.show()
+
+def plot_tsr_analysis(blade_radius=0.5, wind_speeds=[4, 6, 8, 10], axes=None):
+    """Analyze TSR vs power coefficient
 
-def plot_tsr_analysis(blade_radius=0.5, wind_speeds=[4, 6, 8, 10]):
-    """Analyze TSR vs power coefficient"""
+    axes may be a pair of Axes (Cp vs TSR, RPM vs wind speed) to draw onto,
+    in which case the caller owns the figure; otherwise a new figure with
+    both subplots is created and shown.
+    """
+    show = axes is None
+    if show:
+        import matplotlib.pyplot as plt
+        fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    ax_cp, ax_rpm = axes
     tsr_range = np.linspace(1, 15, 100)
     
-    plt.figure(figsize=(12, 5))
-    
     # Plot Cp vs TSR
-    plt.subplot(1, 2, 1)
-    cp_values = []
-    for tsr in tsr_range:
-        # Simplified Cp model
-        a, b, c = 0.5, 0.3, 0.02
-        cp = a * tsr * (1.0 - b * tsr + c * tsr**2)
-        cp_values.append(max(0, cp))
+    cp_values = _cp_curve(tsr_range)
     
-    plt.plot(tsr_range, cp_values, 'b-', linewidth=2)
-    plt.xlabel("Tip Speed Ratio (TSR)")
-    plt.ylabel("Power Coefficient (Cp)")
-    plt.title("Power Coefficient vs TSR")
-    plt.grid(True, alpha=0.3)
+    ax_cp.plot(tsr_range, cp_values, 'b-', linewidth=2)
+    ax_cp.set_xlabel("Tip Speed Ratio (TSR)")
+    ax_cp.set_ylabel("Power Coefficient (Cp)")
+    ax_cp.set_title("Power Coefficient vs TSR")
+    ax_cp.grid(True, alpha=0.3)
     
     # Plot RPM vs wind speed for different TSRs
-    plt.subplot(1, 2, 2)
     wind_speeds_range = np.linspace(2, 20, 100)
     
-    for tsr in [6, 7, 8, 9, 10]:
-        rpm_values = []
-        for v in wind_speeds_range:
-            omega = tsr * v / blade_radius  # rad/s
-            rpm = omega * 60.0 / (2.0 * np.pi)
-            rpm_values.append(rpm)
-        plt.plot(wind_speeds_range, rpm_values, label=f"TSR={tsr}")
+    tsrs = np.array([6, 7, 8, 9, 10])
+    # omega = TSR * v / R (rad/s), converted to RPM
+    rpm = tsrs[:, None] * wind_speeds_range[None, :] * (60.0 / (2.0 * np.pi * blade_radius))
+    for tsr, rpm_values in zip(tsrs, rpm):
+        ax_rpm.plot(wind_speeds_range, rpm_values, label=f"TSR={tsr}")
     
-    plt.xlabel("Wind Speed (m/s)")
-    plt.ylabel("Generator RPM")
-    plt.title(f"RPM vs Wind Speed (R={blade_radius}m)")
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax_rpm.set_xlabel("Wind Speed (m/s)")
+    ax_rpm.set_ylabel("Generator RPM")
+    ax_rpm.set_title(f"RPM vs Wind Speed (R={blade_radius}m)")
+    ax_rpm.legend()
+    ax_rpm.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    if show:
+        fig.tight_layout()
+        plt.show()
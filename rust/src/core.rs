@@ -16,6 +16,13 @@ impl Solver {
         Self { cfg }
     }
 
+    /// Change the operating point in place, keeping blade count and generator
+    pub fn reconfigure(&mut self, env: Env, target_wattage: f64, blade_radius: f64) {
+        self.cfg.env = env;
+        self.cfg.target_wattage = target_wattage;
+        self.cfg.constraints.blade_radius = blade_radius;
+    }
+
     /// Swept area A = π r²
     pub fn rotor_area(&self) -> f64 {
         PI * self.cfg.constraints.blade_radius.powi(2)
@@ -76,6 +83,13 @@ impl Solver {
     }
 }
 
+/// Design summaries for many configurations in one call
+pub fn batch_design(cfgs: Vec<TurbineConfig>) -> Vec<DesignSummary> {
+    cfgs.into_iter()
+        .map(|cfg| Solver::new(cfg).design_summary())
+        .collect()
+}
+
 /// Result struct – serialisable to JSON/CSV
 #[derive(Debug, Serialize)]
 pub struct DesignSummary {
@@ -43,6 +43,11 @@ impl PySolver {
         Self { solver: Solver::new(cfg) }
     }
 
+    /// Reuse this solver for a new operating point (blade count and generator unchanged)
+    pub fn reconfigure(&mut self, env: Env, target_wattage: f64, blade_radius: f64) {
+        self.solver.reconfigure(env, target_wattage, blade_radius);
+    }
+
     /// Return design summary as Python dict
     pub fn design_summary(&self) -> PyResult<PyObject> {
         let summary = self.solver.design_summary();
@@ -50,6 +55,14 @@ impl PySolver {
     }
 }
 
+/// Design summaries for a list of configurations in a single call
+#[pyfunction]
+pub fn batch_design(py: Python, configs: Vec<PyTurbineConfig>) -> PyResult<Vec<PyObject>> {
+    let cfgs: Vec<TurbineConfig> = configs.into_iter().map(Into::into).collect();
+    let summaries = py.allow_threads(|| crate::core::batch_design(cfgs));
+    Ok(summaries.into_iter().map(|s| s.into_py(py)).collect())
+}
+
 /// Implement conversion
 impl From<PyTurbineConfig> for TurbineConfig {
     fn from(p: PyTurbineConfig) -> Self {
@@ -69,5 +82,6 @@ fn wind_calc(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyGeneratorType>()?;
     m.add_class::<PyTurbineConfig>()?;
     m.add_class::<PySolver>()?;
+    m.add_function(wrap_pyfunction!(batch_design, m)?)?;
     Ok(())
 }
\ No newline at end of file
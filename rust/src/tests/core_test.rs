@@ -1,6 +1,6 @@
 #[cfg(test)]
 mod tests {
-    use crate::core::Solver;
+    use crate::core::{batch_design, Solver};
     use crate::types::*;
 
     #[test]
@@ -39,4 +39,55 @@ mod tests {
         assert_eq!(summary.cut_in, 2.5);
         assert_eq!(summary.cut_out, 25.0);
     }
+
+    #[test]
+    fn test_batch_design() {
+        let cfgs: Vec<TurbineConfig> = [0.4, 0.6]
+            .iter()
+            .map(|&r| TurbineConfig {
+                target_wattage: 50.0,
+                env: Env { air_density: 1.225, wind_speed: 6.0 },
+                constraints: Constraints {
+                    blade_radius: r,
+                    num_blades: 3,
+                    generator_type: GeneratorType::Brushless,
+                },
+            })
+            .collect();
+        let summaries = batch_design(cfgs.clone());
+
+        assert_eq!(summaries.len(), 2);
+        for (cfg, summary) in cfgs.into_iter().zip(summaries) {
+            let single = Solver::new(cfg.clone()).design_summary();
+            assert_eq!(summary.blade_length, cfg.constraints.blade_radius);
+            assert_eq!(summary.tsr, single.tsr);
+            assert_eq!(summary.rpm, single.rpm);
+        }
+    }
+
+    #[test]
+    fn test_reconfigure() {
+        let base = TurbineConfig {
+            target_wattage: 50.0,
+            env: Env { air_density: 1.225, wind_speed: 6.0 },
+            constraints: Constraints {
+                blade_radius: 0.5,
+                num_blades: 3,
+                generator_type: GeneratorType::Brushless,
+            },
+        };
+        let mut target = base.clone();
+        target.target_wattage = 100.0;
+        target.env.wind_speed = 8.0;
+        target.constraints.blade_radius = 0.6;
+
+        let mut s = Solver::new(base);
+        s.reconfigure(target.env, target.target_wattage, target.constraints.blade_radius);
+        let reused = s.design_summary();
+        let fresh = Solver::new(target).design_summary();
+
+        assert_eq!(reused.rotor_area, fresh.rotor_area);
+        assert_eq!(reused.tsr, fresh.tsr);
+        assert_eq!(reused.rpm, fresh.rpm);
+    }
 }
\ No newline at end of file